@@ -1,85 +1,298 @@
 import os
+import atexit
+import gzip
+import hashlib
+import queue
+import threading
 import cv2
 import numpy as np
-from flask import Flask, render_template, request, jsonify
-from werkzeug.utils import secure_filename
+import orjson
+from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; pages are still served gzipped
+    brotli = None
+
+try:
+    import redis
+except ImportError:  # redis is optional; the analysis cache stays in-process
+    redis = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to numpy / plain Python kernels
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson so jsonify encodes in C"""
+    options = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.options), mimetype='application/json')
 
 # Initialize Flask app
-app = Flask(__name__)
+app = Flask(__name__, template_folder='Create templates')
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = 4 * 1024 * 1024  # chart screenshots compress well
+# Static files revalidate by default; content-hashed URLs get STATIC_MAX_AGE instead
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = None
+STATIC_MAX_AGE = 365 * 24 * 3600
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Make sure OpenCV dispatches to its SIMD-optimised kernels
+cv2.setUseOptimized(True)
+
+# Configure logging; records are written by a listener thread so request
+# threads never block on stream I/O
+log_handler = QueueHandler(queue.Queue(-1))
+log_listener = None
+
+def start_log_listener():
+    """Start the thread draining the log queue.
+
+    Forked workers must call this again: the parent's listener thread does not
+    survive fork, and its queue may still hold that thread as a waiter.
+    """
+    global log_listener
+    log_handler.queue = queue.Queue(-1)
+    log_listener = QueueListener(log_handler.queue, logging.StreamHandler())
+    log_listener.start()
+
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(), handlers=[log_handler])
+start_log_listener()
+atexit.register(lambda: log_listener.stop())
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def static_version(filename):
+    """Short content hash of a static file, used to version its URL"""
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:12]
+
+def static_url(filename):
+    return f'/static/{filename}?v={static_version(filename)}'
+
+@app.after_request
+def cache_versioned_static(response):
+    # A URL carrying the file's current hash always names the same bytes
+    if (request.endpoint == 'static' and response.status_code == 200
+            and request.args.get('v') == static_version(request.view_args['filename'])):
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        response.cache_control.no_cache = None
+    return response
+
+class PrecompressedPage:
+    """Static page body compressed once at startup and picked per request"""
+
+    def __init__(self, filename):
+        # Rendered once so asset links carry content hashes
+        page = app.jinja_env.get_template(filename).render(static_url=static_url)
+        body = self.minify(page.encode())
+        self.bodies = {'gzip': gzip.compress(body, 9)}
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(body, quality=11)
+        self.body = body
+        self.etag = hashlib.md5(body).hexdigest()
+
+    @staticmethod
+    def minify(body):
+        """Drop indentation and blank lines; line breaks stay so inline JS parses the same"""
+        return b'\n'.join(line.strip() for line in body.splitlines() if line.strip())
+
+    def response(self):
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and request.accept_encodings[encoding]:
+                response = app.response_class(self.bodies[encoding], mimetype='text/html')
+                response.headers['Content-Encoding'] = encoding
+                response.set_etag(f'{self.etag}-{encoding}')
+                break
+        else:
+            response = app.response_class(self.body, mimetype='text/html')
+            response.set_etag(self.etag)
+        response.vary.add('Accept-Encoding')
+        # Revalidate on every load so a deploy shows up at once; unchanged pages get a 304
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        # Answers If-None-Match with an empty 304
+        return response.make_conditional(request)
+
+index_page = PrecompressedPage('index.html')
+
+# Every chart is analysed at this size (width, height)
+CHART_SIZE = (800, 600)
+
+# libjpeg can decode straight to 1/8, 1/4 or 1/2 scale, largest reduction first
+JPEG_REDUCED_MODES = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# JPEG start-of-frame markers, which carry the image dimensions
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Candle bounding boxes in resized-image pixels, one record per candle
+CANDLE_DTYPE = np.dtype([('x', 'i2'), ('y', 'i2'), ('w', 'i2'), ('h', 'i2')])
+
+# HSV bounds for bullish (green) and bearish (red, wraps around hue 0) candles
+GREEN_HSV_RANGE = (np.array([35, 50, 50]), np.array([85, 255, 255]))
+RED_HSV_RANGES = (
+    (np.array([0, 50, 50]), np.array([10, 255, 255])),
+    (np.array([160, 50, 50]), np.array([180, 255, 255])),
+)
+
 # Allowed file extensions
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp'}
+ALLOWED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp'})
+
+# Leading bytes of the allowed formats: PNG, JPEG, GIF and BMP
+IMAGE_SIGNATURES = (b'\x89PNG\r\n\x1a\n', b'\xff\xd8\xff', b'GIF87a', b'GIF89a', b'BM')
+
+@njit(cache=True)
+def _fvg_loop(tops, bottoms):
+    """Scan three-candle windows for fair value gaps.
+
+    Rows are (middle candle index, gap top y, gap bottom y, direction) with
+    direction 1 for bullish and -1 for bearish gaps. Pixel y grows downward.
+    """
+    n = len(tops)
+    out = np.empty((n, 4), np.float64)
+    k = 0
+    for i in range(2, n):
+        if bottoms[i] < tops[i - 2]:
+            out[k, 0] = i - 1
+            out[k, 1] = bottoms[i]
+            out[k, 2] = tops[i - 2]
+            out[k, 3] = 1
+            k += 1
+        elif tops[i] > bottoms[i - 2]:
+            out[k, 0] = i - 1
+            out[k, 1] = bottoms[i - 2]
+            out[k, 2] = tops[i]
+            out[k, 3] = -1
+            k += 1
+    return out[:k]
+
+def _fvg_vectorized(tops, bottoms):
+    """Same result as _fvg_loop using whole-array comparisons instead of a loop"""
+    bull = bottoms[2:] < tops[:-2]
+    bear = ~bull & (tops[2:] > bottoms[:-2])
+    idx = np.flatnonzero(bull | bear)
+    is_bull = bull[idx]
+
+    out = np.empty((len(idx), 4), np.float64)
+    out[:, 0] = idx + 1
+    out[:, 1] = np.where(is_bull, bottoms[idx + 2], bottoms[idx])
+    out[:, 2] = np.where(is_bull, tops[idx], tops[idx + 2])
+    out[:, 3] = np.where(is_bull, 1, -1)
+    return out
+
+# The compiled loop wins when numba is present; otherwise numpy beats a Python loop
+fvg_scan = _fvg_loop if HAVE_NUMBA else _fvg_vectorized
+
+if HAVE_NUMBA:
+    # Compile (or load from the on-disk cache) at import, not on the first upload
+    _fvg_loop(np.zeros(3), np.ones(3))
+
+# Result returned when a chart can't be analyzed; only "error" varies
+FAILED_RESULT = {
+    "signal": "HOLD ⚪",
+    "confidence": 50,
+    "trend": "unknown",
+    "trend_confidence": 0,
+    "price_action": "unclear",
+    "sentiment": "neutral",
+    "fair_value_gaps": 0,
+    "analysis_quality": "poor",
+    "error": None
+}
 
 class TradingSignalAnalyzer:
+    __slots__ = ()
+
     def analyze_chart(self, image):
+        """Return (result, cacheable); only a fallback caused by an exception isn't cacheable"""
         try:
-            print("🔄 Starting chart analysis...")
-
-            image = cv2.resize(image, (800, 600))
-            candles = self.extract_candles(image)
-            if len(candles) < 3:
-                return self.failed_result("Too few candles detected")
-
-            trend_signal, trend_confidence = self.analyze_trend(candles)
-            price_action = self.analyze_price_action(candles)
-            sentiment = self.analyze_candlestick_sentiment(image, candles)
-            signal, confidence = self.generate_signal(trend_signal, trend_confidence, price_action, sentiment)
-
-            return {
-                "signal": signal,
-                "confidence": confidence,
-                "trend": trend_signal,
-                "trend_confidence": trend_confidence,
-                "price_action": price_action,
-                "sentiment": sentiment,
-                "analysis_quality": "good" if confidence > 60 else "medium",
-                "error": None
-            }
-
+            return self.run_analysis(image), True
         except Exception as e:
-            return self.failed_result(str(e))
+            # Analysis failures still answer with the HOLD/poor-quality result the UI expects
+            logger.exception("Chart analysis failed")
+            return self.failed_result(str(e)), False
+
+    def run_analysis(self, image):
+        """Resize the chart and run every analysis step; exceptions propagate"""
+        logger.debug("Starting chart analysis of %dx%d image", image.shape[1], image.shape[0])
+
+        if image.shape[1::-1] != CHART_SIZE:
+            image = cv2.resize(image, CHART_SIZE)
+        candles = self.extract_candles(image)
+        if len(candles) < 3:
+            return self.failed_result("Too few candles detected")
+
+        trend_signal, trend_confidence = self.analyze_trend(candles)
+        price_action = self.analyze_price_action(candles)
+        sentiment = self.analyze_candlestick_sentiment(image, candles)
+        fvgs = self.detect_fair_value_gaps(candles)
+        signal, confidence = self.generate_signal(trend_signal, trend_confidence, price_action, sentiment)
 
-    def failed_result(self, msg):
         return {
-            "signal": "HOLD ⚪",
-            "confidence": 50,
-            "trend": "unknown",
-            "trend_confidence": 0,
-            "price_action": "unclear",
-            "sentiment": "neutral",
-            "analysis_quality": "poor",
-            "error": msg
+            "signal": signal,
+            "confidence": confidence,
+            "trend": trend_signal,
+            "trend_confidence": trend_confidence,
+            "price_action": price_action,
+            "sentiment": sentiment,
+            "fair_value_gaps": len(fvgs),
+            "analysis_quality": "good" if confidence > 60 else "medium",
+            "error": None
         }
 
+    def failed_result(self, msg):
+        return {**FAILED_RESULT, "error": msg}
+
     def extract_candles(self, image):
         """Detect candlestick bodies and positions"""
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         blurred = cv2.GaussianBlur(gray, (5,5), 0)
         _, thresh = cv2.threshold(blurred, 200, 255, cv2.THRESH_BINARY_INV)
 
+        # Outermost shapes only, so marks inside a frame or label box aren't counted
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        candles = []
-        for cnt in contours:
-            x, y, w, h = cv2.boundingRect(cnt)
-            if h > 5 and w < 20:  # likely a candle body
-                candles.append((x, y, w, h))
-        candles.sort(key=lambda c: c[0])  # left to right
+        boxes = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int32).reshape(-1, 4)
+        boxes = boxes[(boxes[:, 3] > 5) & (boxes[:, 2] < 20)]  # likely candle bodies
+        boxes = boxes[np.argsort(boxes[:, 0], kind='stable')]  # left to right
+
+        candles = np.empty(len(boxes), dtype=CANDLE_DTYPE)
+        candles['x'], candles['y'], candles['w'], candles['h'] = boxes.T
         return candles
 
     def analyze_trend(self, candles):
         """Determine trend from candle positions"""
-        closes = [c[1] + c[3] for c in candles]  # bottom of candle as close
+        closes = candles['y'] + candles['h']  # bottom of candle as close
         if len(closes) < 3:
             return "neutral", 50
 
@@ -96,11 +309,11 @@ class TradingSignalAnalyzer:
 
     def analyze_price_action(self, candles):
         """Basic market condition based on candle heights"""
-        heights = [c[3] for c in candles]
+        heights = candles['h']
         if len(heights) == 0:
             return "unclear"
             
-        if max(heights) / np.mean(heights) > 2:
+        if heights.max() / np.mean(heights) > 2:
             return "trending"
         elif np.std(heights) < 3:
             return "ranging"
@@ -110,15 +323,8 @@ class TradingSignalAnalyzer:
     def analyze_candlestick_sentiment(self, image, candles):
         """Detect bullish or bearish sentiment using candle colors"""
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        green_lower = np.array([35, 50, 50])
-        green_upper = np.array([85, 255, 255])
-        green_mask = cv2.inRange(hsv, green_lower, green_upper)
-
-        red_lower1 = np.array([0, 50, 50])
-        red_upper1 = np.array([10, 255, 255])
-        red_lower2 = np.array([160, 50, 50])
-        red_upper2 = np.array([180, 255, 255])
-        red_mask = cv2.inRange(hsv, red_lower1, red_upper1) + cv2.inRange(hsv, red_lower2, red_upper2)
+        green_mask = cv2.inRange(hsv, *GREEN_HSV_RANGE)
+        red_mask = cv2.inRange(hsv, *RED_HSV_RANGES[0]) + cv2.inRange(hsv, *RED_HSV_RANGES[1])
 
         green_pixels = cv2.countNonZero(green_mask)
         red_pixels = cv2.countNonZero(red_mask)
@@ -132,6 +338,12 @@ class TradingSignalAnalyzer:
         else:
             return "neutral"
 
+    def detect_fair_value_gaps(self, candles):
+        """Find three-candle imbalances where the outer candles don't overlap"""
+        tops = candles['y'].astype(np.float64)
+        bottoms = tops + candles['h']
+        return fvg_scan(tops, bottoms)
+
     def generate_signal(self, trend, trend_conf, price_action, sentiment):
         """Generate a final BUY/SELL/HOLD signal"""
         score = 0
@@ -151,51 +363,207 @@ class TradingSignalAnalyzer:
         elif score <= -1.0: return "SELL 🔴", min(85, base_conf + 15)
         else: return "HOLD ⚪", max(50, base_conf - 10)
 
+# The analyzer is stateless, so one instance serves every request
+analyzer = TradingSignalAnalyzer()
+
+class AnalysisCache:
+    """Bounded cache of encoded analysis results keyed by a digest of the uploaded bytes.
+
+    Values are the JSON response bodies, so a hit skips encoding as well as
+    analysis. Readers never lock: writers build a new dict and publish it with
+    a single reference store, so a lookup always sees a complete mapping.
+    Eviction is oldest-inserted first. When a Redis client is given, bodies are
+    also shared across workers with a short TTL.
+    """
+
+    def __init__(self, maxsize=256, backend=None, ttl=60):
+        self.maxsize = maxsize
+        self.backend = backend
+        self.ttl = ttl
+        self._entries = {}
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def key(buf):
+        return hashlib.blake2b(buf, digest_size=16).digest()
+
+    def get(self, key):
+        payload = self._entries.get(key)
+        if payload is None and self.backend is not None:
+            try:
+                payload = self.backend.get(b'analysis:' + key)
+            except redis.RedisError as e:
+                logger.warning("Analysis cache lookup failed: %s", e)
+                payload = None
+            if payload is not None:
+                self._store(key, payload)
+        return payload
+
+    def put(self, key, payload):
+        self._store(key, payload)
+        if self.backend is not None:
+            try:
+                self.backend.setex(b'analysis:' + key, self.ttl, payload)
+            except redis.RedisError as e:
+                logger.warning("Analysis cache store failed: %s", e)
+
+    def _store(self, key, payload):
+        with self._write_lock:
+            entries = dict(self._entries)
+            entries[key] = payload
+            while len(entries) > self.maxsize:
+                del entries[next(iter(entries))]
+            self._entries = entries
+
+def redis_backend():
+    """Redis client for the shared analysis cache, if REDIS_URL is configured"""
+    url = os.environ.get('REDIS_URL')
+    if not url or redis is None:
+        return None
+    # Short timeouts: an unreachable Redis must read as a cache miss, not stall the request
+    return redis.Redis.from_url(url, socket_connect_timeout=0.25, socket_timeout=0.25)
+
+analysis_cache = AnalysisCache(backend=redis_backend())
+
+def read_image_buffer(file):
+    """Read an uploaded file into a uint8 buffer without an intermediate bytes copy"""
+    stream = file.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+
+    readinto = getattr(stream, 'readinto', None)
+    if readinto is None:
+        return np.frombuffer(stream.read(size), np.uint8)
+
+    buf = np.empty(size, np.uint8)
+    view = memoryview(buf)
+    filled = 0
+    while filled < size:
+        n = readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    return buf[:filled]
+
+def jpeg_size(buf):
+    """Return (width, height) from a JPEG's frame header, or None if not found"""
+    data = buf.data  # index the buffer in place rather than copying it to bytes
+    n = len(data)
+    if n < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            return (data[i + 7] << 8 | data[i + 8]), (data[i + 5] << 8 | data[i + 6])
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # markers without a payload
+            i += 2
+            continue
+        i += 2 + (data[i + 2] << 8 | data[i + 3])
+    return None
+
+def decode_image(buf):
+    """Decode an upload to a chart-sized image, or None if it can't be decoded.
+
+    Large JPEGs are decoded at reduced scale so libjpeg skips detail the resize
+    would discard; the full-size frame is released before analysis starts.
+    """
+    flags = cv2.IMREAD_COLOR
+    size = jpeg_size(buf)
+    if size is not None:
+        # Compare sorted sides so an EXIF rotation can't push either below the chart size
+        short, long = sorted(size)
+        for factor, reduced in JPEG_REDUCED_MODES:
+            if short // factor >= min(CHART_SIZE) and long // factor >= max(CHART_SIZE):
+                flags = reduced
+                break
+    image = cv2.imdecode(buf, flags)
+    if image is None:
+        return None
+    return cv2.resize(image, CHART_SIZE)
+
+def has_image_signature(stream):
+    """Peek at the upload's magic bytes without consuming the stream"""
+    head = stream.read(12)
+    stream.seek(0)
+    return head.startswith(IMAGE_SIGNATURES)
+
+@lru_cache(maxsize=1024)
 def allowed_file(filename):
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return index_page.response()
 
 @app.route('/analyze', methods=['POST'])
 def analyze_chart():
-    try:
-        # Check if a file was uploaded
-        if 'file' not in request.files:
-            return jsonify({'error': 'No file uploaded'}), 400
-        
-        file = request.files['file']
-        
-        # Check if file is selected
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
-        
-        if file and allowed_file(file.filename):
-            # Read and process the image
-            filestr = file.read()
-            npimg = np.frombuffer(filestr, np.uint8)
-            image = cv2.imdecode(npimg, cv2.IMREAD_COLOR)
-            
+    # Check if a file was uploaded
+    if 'file' not in request.files:
+        return jsonify({'error': 'No file uploaded'}), 400
+    
+    file = request.files['file']
+    
+    # Check if file is selected
+    if file.filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+    
+    if file and allowed_file(file.filename):
+        # Reject non-images before pulling the whole body into memory
+        if not has_image_signature(file.stream):
+            return jsonify({'error': 'Invalid image file'}), 400
+
+        # Read the upload straight into a numpy buffer and decode it
+        npimg = read_image_buffer(file)
+
+        # Re-uploads of the same chart skip decoding and analysis
+        key = analysis_cache.key(npimg)
+        payload = analysis_cache.get(key)
+        cache_status = 'HIT'
+        if payload is None:
+            cache_status = 'MISS'
+            image = decode_image(npimg)
+            del npimg  # only the decoded pixels are needed from here on
+
             if image is None:
                 return jsonify({'error': 'Invalid image file'}), 400
-            
+
             # Analyze the chart
-            analyzer = TradingSignalAnalyzer()
-            result = analyzer.analyze_chart(image)
-            
-            return jsonify(result)
-        else:
-            return jsonify({'error': 'File type not allowed'}), 400
-            
-    except Exception as e:
-        logger.error(f"Analysis error: {str(e)}")
-        return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
+            result, cacheable = analyzer.analyze_chart(image)
+            payload = orjson.dumps(result, option=OrjsonProvider.options)
+            if cacheable:  # a one-off failure must not be replayed to retries
+                analysis_cache.put(key, payload)
+
+        response = app.response_class(payload, mimetype='application/json')
+        response.headers['X-Cache'] = cache_status
+        return response
+    else:
+        return jsonify({'error': 'File type not allowed'}), 400
+
+@app.errorhandler(Exception)
+def unexpected_error(e):
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Analysis error: %s", e)
+    return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
+
+@app.errorhandler(RequestEntityTooLarge)
+def file_too_large(e):
+    limit_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'error': f'File too large (max {limit_mb}MB)'}), 413
+
+# Health payload never changes, so encode it once
+HEALTH_JSON = orjson.dumps({'status': 'healthy', 'message': 'Trading Chart Analyzer is running'})
 
 @app.route('/health')
 def health_check():
-    return jsonify({'status': 'healthy', 'message': 'Trading Chart Analyzer is running'})
+    return app.response_class(HEALTH_JSON, mimetype='application/json')
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
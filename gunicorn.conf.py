@@ -0,0 +1,16 @@
+import multiprocessing
+import os
+
+# Threaded workers so concurrent uploads don't queue behind one image decode
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2))
+worker_class = 'gthread'
+threads = 4
+
+# Import the app once in the master so workers share its startup work copy-on-write
+preload_app = True
+
+def post_fork(server, worker):
+    # Threads don't survive fork; give each worker its own log listener
+    import app
+    app.start_log_listener()
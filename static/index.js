@@ -0,0 +1,49 @@
+document.getElementById('uploadForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    const formData = new FormData();
+    formData.append('file', document.querySelector('input[type=file]').files[0]);
+    
+    try {
+        const response = await fetch('/analyze', {
+            method: 'POST',
+            body: formData
+        });
+        
+        const result = await response.json();
+        displayResult(result);
+        
+    } catch (error) {
+        displayResult({error: 'Analysis failed: ' + error.message});
+    }
+});
+
+function displayResult(result) {
+    const resultDiv = document.getElementById('result');
+    
+    if (result.error) {
+        resultDiv.innerHTML = `<h3>Error</h3><p>${result.error}</p>`;
+        resultDiv.className = 'result';
+        resultDiv.style.display = 'block';
+        return;
+    }
+
+    let signalClass = 'hold';
+    if (result.signal.includes('BUY')) signalClass = 'buy';
+    else if (result.signal.includes('SELL')) signalClass = 'sell';
+
+    resultDiv.innerHTML = `
+        <h3>Analysis Result</h3>
+        <div class="${signalClass}">
+            <h2>${result.signal}</h2>
+            <p><strong>Confidence:</strong> ${result.confidence}%</p>
+            <p><strong>Trend:</strong> ${result.trend} (${result.trend_confidence}%)</p>
+            <p><strong>Price Action:</strong> ${result.price_action}</p>
+            <p><strong>Sentiment:</strong> ${result.sentiment}</p>
+            <p><strong>Fair Value Gaps:</strong> ${result.fair_value_gaps}</p>
+            <p><strong>Quality:</strong> ${result.analysis_quality}</p>
+            ${result.candles_detected ? `<p><strong>Candles Detected:</strong> ${result.candles_detected}</p>` : ''}
+        </div>
+    `;
+    resultDiv.style.display = 'block';
+}